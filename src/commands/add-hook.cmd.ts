@@ -1,5 +1,4 @@
 import { defineCommand } from 'citty';
-import { add_hook_command } from './add-hook.js';
 
 export default defineCommand({
 	meta: {
@@ -25,7 +24,8 @@ export default defineCommand({
 			description: 'Replace existing hook without prompting',
 		},
 	},
-	run({ args }) {
+	async run({ args }) {
+		const { add_hook_command } = await import('./add-hook.js');
 		add_hook_command({
 			local: args.local,
 			project: args.project,
@@ -1,5 +1,4 @@
 import { defineCommand } from 'citty';
-import { doctor_command } from './doctor.js';
 
 export default defineCommand({
 	meta: {
@@ -13,7 +12,8 @@ export default defineCommand({
 			required: true,
 		},
 	},
-	run({ args }) {
+	async run({ args }) {
+		const { doctor_command } = await import('./doctor.js');
 		doctor_command({ skill_path: args.skill_path });
 	},
 });
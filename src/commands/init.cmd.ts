@@ -1,5 +1,4 @@
 import { defineCommand } from 'citty';
-import { init_command } from './init.js';
 
 export default defineCommand({
 	meta: { name: 'init', description: 'Create a new skill' },
@@ -26,7 +25,8 @@ export default defineCommand({
 				'Install skill in ~/.claude/skills/ (available in all projects)',
 		},
 	},
-	run({ args }) {
+	async run({ args }) {
+		const { init_command } = await import('./init.js');
 		init_command({
 			name: args.name,
 			description: args.description,
@@ -77,9 +77,14 @@ function create_skill(
 	with_examples: boolean = false,
 	global: boolean = false,
 ): void {
-	// Create base directories
-	ensure_dir(path);
-	ensure_dir(join(path, 'references'));
+	// Create only the leaf directories: each recursive mkdir also
+	// creates the skill directory itself if needed
+	const directories = with_examples
+		? ['references', 'scripts', 'assets']
+		: ['references'];
+	for (const directory of directories) {
+		ensure_dir(join(path, directory));
+	}
 
 	// Create SKILL.md
 	const title = to_title_case(name);
@@ -93,10 +98,6 @@ function create_skill(
 
 	// Only create example files if requested
 	if (with_examples) {
-		// Create example directories
-		ensure_dir(join(path, 'scripts'));
-		ensure_dir(join(path, 'assets'));
-
 		// Create example reference
 		const reference_md = REFERENCE_TEMPLATE(title);
 		write_file(
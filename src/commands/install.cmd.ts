@@ -1,5 +1,4 @@
 import { defineCommand } from 'citty';
-import { install_command } from './install.js';
 
 export default defineCommand({
 	meta: { name: 'install', description: 'Install a bundled skill' },
@@ -14,7 +13,8 @@ export default defineCommand({
 			description: 'Replace existing skill without prompting',
 		},
 	},
-	run({ args }) {
+	async run({ args }) {
+		const { install_command } = await import('./install.js');
 		install_command({
 			skill_name: args.skill_name,
 			force: args.force,
@@ -1,5 +1,4 @@
 import { defineCommand } from 'citty';
-import { package_command } from './package.js';
 
 export default defineCommand({
 	meta: { name: 'package', description: 'Package a skill to zip' },
@@ -19,6 +18,7 @@ export default defineCommand({
 		},
 	},
 	async run({ args }) {
+		const { package_command } = await import('./package.js');
 		await package_command({
 			skill_path: args.skill_path,
 			output: args.output,
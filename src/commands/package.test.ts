@@ -0,0 +1,216 @@
+import {
+	mkdirSync,
+	mkdtempSync,
+	readdirSync,
+	rmSync,
+	symlinkSync,
+	writeFileSync,
+} from 'node:fs';
+import { tmpdir } from 'node:os';
+import { dirname, join } from 'node:path';
+import {
+	afterEach,
+	beforeEach,
+	describe,
+	expect,
+	it,
+	vi,
+} from 'vitest';
+import { METHOD_DEFLATED, METHOD_STORED } from '../utils/zip.js';
+import { read_zip_entries } from '../utils/zip-test-helpers.js';
+import { package_command } from './package.js';
+
+describe('package_command', () => {
+	let tmp_dir: string;
+	let skill_path: string;
+	let output_dir: string;
+	let exit_spy: ReturnType<typeof vi.spyOn>;
+	let console_log_spy: ReturnType<typeof vi.spyOn>;
+
+	beforeEach(() => {
+		tmp_dir = mkdtempSync(join(tmpdir(), 'package-test-'));
+		skill_path = join(tmp_dir, 'test-skill');
+		output_dir = join(tmp_dir, 'dist');
+		mkdirSync(skill_path);
+		writeFileSync(
+			join(skill_path, 'SKILL.md'),
+			'---\nname: test-skill\ndescription: A valid description for testing.\n---\n# Test',
+		);
+		// Prevent process.exit from actually exiting
+		exit_spy = vi
+			.spyOn(process, 'exit')
+			.mockImplementation((() => {}) as never);
+		console_log_spy = vi
+			.spyOn(console, 'log')
+			.mockImplementation(() => {});
+	});
+
+	afterEach(() => {
+		rmSync(tmp_dir, { recursive: true, force: true });
+		exit_spy.mockRestore();
+		console_log_spy.mockRestore();
+	});
+
+	function add_file(relative_path: string, content: string): void {
+		const file_path = join(skill_path, relative_path);
+		mkdirSync(dirname(file_path), { recursive: true });
+		writeFileSync(file_path, content);
+	}
+
+	async function package_skill(): Promise<void> {
+		await package_command({
+			skill_path,
+			output: output_dir,
+			skip_validation: true,
+		});
+	}
+
+	// Map each entry name to its compression method
+	function read_entries(): Map<string, number> {
+		const entries = read_zip_entries(
+			join(output_dir, 'test-skill.zip'),
+		);
+		return new Map(
+			entries.map((entry) => [entry.name, entry.method]),
+		);
+	}
+
+	it('should package files under the skill name', async () => {
+		add_file('references/guide.md', '# Guide');
+		await package_skill();
+
+		expect([...read_entries().keys()].sort()).toEqual([
+			'test-skill/SKILL.md',
+			'test-skill/references/guide.md',
+		]);
+	});
+
+	it('should prune hidden and skipped directories', async () => {
+		add_file('.git/config', '[core]');
+		add_file('node_modules/pkg/index.js', 'x');
+		add_file('scripts/__pycache__/tool.cpython-312.pyc', 'x');
+		add_file('scripts/tool.py', 'print()');
+		await package_skill();
+
+		expect([...read_entries().keys()].sort()).toEqual([
+			'test-skill/SKILL.md',
+			'test-skill/scripts/tool.py',
+		]);
+	});
+
+	it('should keep hidden files below the skill root', async () => {
+		add_file('.env', 'x');
+		add_file('scripts/.env', 'x');
+		add_file('assets/.gitkeep', '');
+		add_file('references/.DS_Store', 'x');
+		add_file('references/guide.md', '# Guide');
+		await package_skill();
+
+		expect([...read_entries().keys()].sort()).toEqual([
+			'test-skill/SKILL.md',
+			'test-skill/assets/.gitkeep',
+			'test-skill/references/guide.md',
+			'test-skill/scripts/.env',
+		]);
+	});
+
+	it('should exclude backup, swap and compiled files', async () => {
+		add_file('.DS_Store', 'x');
+		add_file('SKILL.md~', 'x');
+		add_file('.SKILL.md.swp', 'x');
+		add_file('notes.swp', 'x');
+		add_file('scripts/tool.pyc', 'x');
+		add_file('assets/Thumbs.db', 'x');
+		await package_skill();
+
+		// Directories left empty are still kept
+		expect([...read_entries().keys()].sort()).toEqual([
+			'test-skill/SKILL.md',
+			'test-skill/assets/',
+			'test-skill/scripts/',
+		]);
+	});
+
+	it('should keep empty directories as stored entries', async () => {
+		mkdirSync(join(skill_path, 'assets'));
+		add_file('references/guide.md', '# Guide');
+		await package_skill();
+
+		const entries = read_entries();
+		expect([...entries.keys()].sort()).toEqual([
+			'test-skill/SKILL.md',
+			'test-skill/assets/',
+			'test-skill/references/guide.md',
+		]);
+		expect(entries.get('test-skill/assets/')).toBe(METHOD_STORED);
+	});
+
+	it('should store already-compressed files', async () => {
+		const text = 'compressible text\n'.repeat(100);
+		add_file('assets/image.png', text);
+		add_file('references/guide.md', text);
+		await package_skill();
+
+		const entries = read_entries();
+		expect(entries.get('test-skill/assets/image.png')).toBe(
+			METHOD_STORED,
+		);
+		expect(entries.get('test-skill/references/guide.md')).toBe(
+			METHOD_DEFLATED,
+		);
+	});
+
+	it('should pack a directory linked from two places', async () => {
+		add_file('shared/a.md', '# A');
+		symlinkSync('shared', join(skill_path, 'alias'));
+		await package_skill();
+
+		expect([...read_entries().keys()].sort()).toEqual([
+			'test-skill/SKILL.md',
+			'test-skill/alias/a.md',
+			'test-skill/shared/a.md',
+		]);
+	});
+
+	it('should stop at a symlink back to an ancestor', async () => {
+		add_file('references/guide.md', '# Guide');
+		symlinkSync('..', join(skill_path, 'references', 'up'));
+		await package_skill();
+
+		expect([...read_entries().keys()].sort()).toEqual([
+			'test-skill/SKILL.md',
+			'test-skill/references/guide.md',
+		]);
+	});
+
+	it('should not pack its own output', async () => {
+		output_dir = join(skill_path, 'dist');
+		await package_skill();
+		await package_skill();
+
+		// The output directory itself is kept, as zip -r kept it
+		expect([...read_entries().keys()].sort()).toEqual([
+			'test-skill/SKILL.md',
+			'test-skill/dist/',
+		]);
+	});
+
+	it('should leave no temp file after packaging', async () => {
+		await package_skill();
+
+		expect(readdirSync(output_dir)).toEqual(['test-skill.zip']);
+	});
+
+	it('should remove the temp file when packaging fails', async () => {
+		// A non-empty directory at the output path makes the final
+		// rename fail
+		mkdirSync(join(output_dir, 'test-skill.zip'), {
+			recursive: true,
+		});
+		writeFileSync(join(output_dir, 'test-skill.zip', 'keep'), '');
+		await package_skill();
+
+		expect(exit_spy).toHaveBeenCalledWith(1);
+		expect(readdirSync(output_dir)).toEqual(['test-skill.zip']);
+	});
+});
@@ -1,6 +1,22 @@
-import { execSync } from 'node:child_process';
-import { existsSync, statSync } from 'node:fs';
-import { basename, join, resolve } from 'node:path';
+import {
+	closeSync,
+	existsSync,
+	fstatSync,
+	openSync,
+	readdirSync,
+	readFileSync,
+	realpathSync,
+	renameSync,
+	rmSync,
+	statSync,
+} from 'node:fs';
+import {
+	basename,
+	extname,
+	join,
+	relative,
+	resolve,
+} from 'node:path';
 import { SkillValidator } from '../core/validator.js';
 import type { PackageOptions } from '../types.js';
 import { ensure_dir } from '../utils/fs.js';
@@ -12,6 +28,54 @@ import {
 	upload,
 	warning,
 } from '../utils/output.js';
+import { ZipWriter } from '../utils/zip.js';
+
+/**
+ * Directories never packaged; pruned before descending into them
+ */
+const SKIPPED_DIRECTORIES = new Set(['node_modules', '__pycache__']);
+
+/**
+ * OS metadata files and editor/compiler leftovers never packaged
+ * (`~` backups are skipped by suffix, and hidden entries at the skill
+ * root by prefix)
+ */
+const SKIPPED_FILE_NAMES = new Set([
+	'.DS_Store',
+	'Thumbs.db',
+	'desktop.ini',
+]);
+const SKIPPED_FILE_EXTENSIONS = new Set(['.swp', '.pyc', '.pyo']);
+
+/**
+ * Already-compressed formats, stored as-is instead of deflated again
+ */
+const STORED_EXTENSIONS = new Set([
+	'.png',
+	'.jpg',
+	'.jpeg',
+	'.gif',
+	'.webp',
+	'.zip',
+	'.gz',
+	'.xz',
+	'.zst',
+	'.mp3',
+	'.mp4',
+	'.pdf',
+]);
+
+/**
+ * Files above this size are streamed into the archive in chunks
+ * instead of being read into memory whole
+ */
+const STREAM_THRESHOLD = 1024 * 1024;
+
+/**
+ * Deflate level for text and code — slightly larger output than the
+ * default level 6, but roughly twice as fast
+ */
+const COMPRESSION_LEVEL = 3;
 
 function validate_skill(skill_path: string): boolean {
 	search('Validating skill...');
@@ -43,6 +107,77 @@ function validate_skill(skill_path: string): boolean {
 	}
 }
 
+/**
+ * Collect files to package, as paths relative to the skill's parent
+ * directory (so every entry is prefixed with the skill name).
+ * Symlinks are followed, as `zip -r` did. Directories left with
+ * nothing to package are listed with a trailing `/`, so they are
+ * kept as empty directory entries. Absolute paths in `excluded` are
+ * left out, so an output directory inside the skill never packs the
+ * archive itself.
+ */
+function collect_files(
+	skill_path: string,
+	excluded: Set<string>,
+): string[] {
+	const root = resolve(skill_path);
+	const parent_dir = resolve(root, '..');
+	const files: string[] = [];
+	// Each directory carries the real paths of its ancestors, so only
+	// a symlink back up the current branch is cut; a directory linked
+	// from two places is packed under both, as with `zip -r`
+	const stack = [{ dir: root, ancestors: [] as string[] }];
+
+	while (stack.length > 0) {
+		const { dir, ancestors } = stack.pop()!;
+		const real_dir = realpathSync(dir);
+		if (ancestors.includes(real_dir)) continue;
+		const branch = [...ancestors, real_dir];
+		let kept = 0;
+
+		for (const entry of readdirSync(dir, { withFileTypes: true })) {
+			// Skip hidden entries at the skill root only (.git, .env,
+			// ...), as the `${skill_name}/.*` zip pattern did
+			if (dir === root && entry.name.startsWith('.')) continue;
+
+			const entry_path = join(dir, entry.name);
+			let is_directory = entry.isDirectory();
+			let is_file = entry.isFile();
+			if (entry.isSymbolicLink()) {
+				// Classify by the link target; dangling links are skipped
+				const target = statSync(entry_path, {
+					throwIfNoEntry: false,
+				});
+				is_directory = target?.isDirectory() ?? false;
+				is_file = target?.isFile() ?? false;
+			}
+
+			if (is_directory) {
+				// Prune the whole subtree rather than filtering its files
+				if (!SKIPPED_DIRECTORIES.has(entry.name)) {
+					stack.push({ dir: entry_path, ancestors: branch });
+					kept++;
+				}
+			} else if (
+				is_file &&
+				!excluded.has(entry_path) &&
+				!entry.name.endsWith('~') &&
+				!SKIPPED_FILE_NAMES.has(entry.name) &&
+				!SKIPPED_FILE_EXTENSIONS.has(extname(entry.name))
+			) {
+				files.push(relative(parent_dir, entry_path));
+				kept++;
+			}
+		}
+
+		if (kept === 0) {
+			files.push(`${relative(parent_dir, dir)}/`);
+		}
+	}
+
+	return files;
+}
+
 function package_skill(
 	skill_path: string,
 	output_dir: string,
@@ -54,17 +189,59 @@ function package_skill(
 
 	ensure_dir(output_dir);
 
-	// Remove existing zip if present
-	if (existsSync(output_file)) {
-		execSync(`rm ${output_file}`);
-	}
-
-	// Use system zip command — available on all target platforms
+	// Build the archive in-process — no dependency on a system zip.
+	// It is written beside the output and renamed into place, so a
+	// failed run never leaves a truncated zip at the output path.
 	const parent_dir = resolve(skill_path, '..');
-	execSync(
-		`cd "${parent_dir}" && zip -r "${output_file}" "${skill_name}" -x '${skill_name}/.*' '${skill_name}/*.swp' '${skill_name}/*~' '${skill_name}/.DS_Store'`,
+	const temp_file = `${output_file}.tmp`;
+	const files = collect_files(
+		skill_path,
+		new Set([output_file, temp_file]),
 	);
 
+	const zip = new ZipWriter(temp_file, {
+		level: COMPRESSION_LEVEL,
+	});
+	try {
+		try {
+			for (const file of files) {
+				if (file.endsWith('/')) {
+					const { mtime, mode } = statSync(join(parent_dir, file));
+					zip.add_directory(file, { mtime, mode });
+					continue;
+				}
+
+				// Open once and take both metadata and contents from the
+				// descriptor, rather than resolving the path for each
+				const fd = openSync(join(parent_dir, file), 'r');
+				try {
+					const { mtime, mode, size } = fstatSync(fd);
+					const file_options = {
+						mtime,
+						mode,
+						store: STORED_EXTENSIONS.has(
+							extname(file).toLowerCase(),
+						),
+					};
+					if (size > STREAM_THRESHOLD) {
+						zip.add_file_from_fd(file, fd, file_options);
+					} else {
+						zip.add_file(file, readFileSync(fd), file_options);
+					}
+				} finally {
+					closeSync(fd);
+				}
+			}
+		} finally {
+			// Always closes the descriptor, even if it throws
+			zip.close();
+		}
+		renameSync(temp_file, output_file);
+	} catch (err) {
+		rmSync(temp_file, { force: true });
+		throw err;
+	}
+
 	return output_file;
 }
 
@@ -73,13 +250,13 @@ export async function package_command(
 ): Promise<void> {
 	const { skill_path, output, skip_validation } = options;
 
-	// Validate path
-	if (!existsSync(skill_path)) {
+	// Validate path (a single stat covers both checks)
+	const stats = statSync(skill_path, { throwIfNoEntry: false });
+	if (!stats) {
 		error(`Skill directory does not exist: ${skill_path}`);
 		process.exit(1);
 	}
 
-	const stats = statSync(skill_path);
 	if (!stats.isDirectory()) {
 		error(`Path is not a directory: ${skill_path}`);
 		process.exit(1);
@@ -1,5 +1,4 @@
 import { defineCommand } from 'citty';
-import { stats_command } from './stats.js';
 
 export default defineCommand({
 	meta: {
@@ -14,7 +13,8 @@ export default defineCommand({
 			required: false,
 		},
 	},
-	run({ args }) {
+	async run({ args }) {
+		const { stats_command } = await import('./stats.js');
 		stats_command({ directory: args.directory });
 	},
 });
@@ -1,5 +1,4 @@
 import { defineCommand } from 'citty';
-import { validate_command } from './validate.js';
 
 export default defineCommand({
 	meta: { name: 'validate', description: 'Validate a skill' },
@@ -27,7 +26,8 @@ export default defineCommand({
 			description: 'Use Anthropic official limits (500 lines max)',
 		},
 	},
-	run({ args }) {
+	async run({ args }) {
+		const { validate_command } = await import('./validate.js');
 		validate_command({
 			skill_path: args.skill_path,
 			strict: args.strict,
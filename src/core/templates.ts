@@ -1,10 +1,28 @@
-export const SKILL_MD_TEMPLATE = (
+/**
+ * Guidance comment shared by both SKILL.md templates, built once
+ */
+const SKILL_MD_GUIDELINES = `<!--
+PROGRESSIVE DISCLOSURE GUIDELINES:
+- Keep this file ~50 lines total (max ~150 lines)
+- Use 1-2 code blocks only (recommend 1)
+- Keep description <250 chars (Claude truncates at this limit)
+- Move detailed docs to references/ for Level 3 loading
+- This is Level 2 - quick reference ONLY, not a manual
+
+LLM WORKFLOW (when editing this file):
+1. Write/edit SKILL.md
+2. Format (if formatter available)
+3. Run: claude-skills-cli validate <path>
+4. If multi-line description warning: run claude-skills-cli doctor <path>
+5. Validate again to confirm
+-->
+`;
+
+const minimal_skill_md = (
 	name: string,
 	description: string,
 	title: string,
-	include_examples: boolean = false,
-) => {
-	const minimal_template = `---
+) => `---
 name: ${name}
 # Keep on ONE line, third-person voice, include "Use when/for/to..." trigger
 # prettier-ignore
@@ -48,24 +66,13 @@ For detailed documentation, see:
 - Important note 1
 - Important note 2
 
-<!--
-PROGRESSIVE DISCLOSURE GUIDELINES:
-- Keep this file ~50 lines total (max ~150 lines)
-- Use 1-2 code blocks only (recommend 1)
-- Keep description <250 chars (Claude truncates at this limit)
-- Move detailed docs to references/ for Level 3 loading
-- This is Level 2 - quick reference ONLY, not a manual
-
-LLM WORKFLOW (when editing this file):
-1. Write/edit SKILL.md
-2. Format (if formatter available)
-3. Run: claude-skills-cli validate <path>
-4. If multi-line description warning: run claude-skills-cli doctor <path>
-5. Validate again to confirm
--->
-`;
+${SKILL_MD_GUIDELINES}`;
 
-	const full_template = `---
+const full_skill_md = (
+	name: string,
+	description: string,
+	title: string,
+) => `---
 name: ${name}
 # Keep on ONE line, third-person voice, include "Use when/for/to..." trigger
 # prettier-ignore
@@ -110,25 +117,18 @@ For detailed documentation, see:
 - Important note 1
 - Important note 2
 
-<!--
-PROGRESSIVE DISCLOSURE GUIDELINES:
-- Keep this file ~50 lines total (max ~150 lines)
-- Use 1-2 code blocks only (recommend 1)
-- Keep description <250 chars (Claude truncates at this limit)
-- Move detailed docs to references/ for Level 3 loading
-- This is Level 2 - quick reference ONLY, not a manual
+${SKILL_MD_GUIDELINES}`;
 
-LLM WORKFLOW (when editing this file):
-1. Write/edit SKILL.md
-2. Format (if formatter available)
-3. Run: claude-skills-cli validate <path>
-4. If multi-line description warning: run claude-skills-cli doctor <path>
-5. Validate again to confirm
--->
-`;
-
-	return include_examples ? full_template : minimal_template;
-};
+// Only the requested variant is built
+export const SKILL_MD_TEMPLATE = (
+	name: string,
+	description: string,
+	title: string,
+	include_examples: boolean = false,
+) =>
+	include_examples
+		? full_skill_md(name, description, title)
+		: minimal_skill_md(name, description, title);
 
 export const REFERENCE_TEMPLATE = (
 	title: string,
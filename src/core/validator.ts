@@ -7,6 +7,7 @@ import {
 } from '../constants.js';
 import type {
 	StructuredValidation,
+	ValidationMode,
 	ValidationResult,
 	ValidationStats,
 } from '../types.js';
@@ -34,8 +35,6 @@ import {
 import { validate_dependencies } from '../validators/dependency-validator.js';
 import { validate_references } from '../validators/references-validator.js';
 
-import type { ValidationMode } from '../types.js';
-
 export interface ValidatorOptions {
 	mode?: ValidationMode;
 }
@@ -43,6 +42,8 @@ export interface ValidatorOptions {
 export class SkillValidator {
 	private skill_path: string;
 	private options: ValidatorOptions;
+	// SKILL.md as read by validate_skill_md, reused by later checks
+	private skill_md_content: string | undefined;
 	private errors: string[] = [];
 	private warnings: string[] = [];
 	private stats: ValidationStats = {
@@ -142,6 +143,7 @@ export class SkillValidator {
 		}
 
 		const content = readFileSync(skill_md_path, 'utf-8');
+		this.skill_md_content = content;
 
 		// Validate path formats (no Windows backslashes)
 		const path_format_result = validate_path_formats(content);
@@ -320,7 +322,10 @@ export class SkillValidator {
 		this.validate_skill_md();
 
 		// Validate references
-		const refs_result = validate_references(this.skill_path);
+		const refs_result = validate_references(
+			this.skill_path,
+			this.skill_md_content,
+		);
 		refs_result.errors.forEach((err) => this.error(err.message));
 		refs_result.warnings.forEach((warn) =>
 			this.warning(warn.message),
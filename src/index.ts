@@ -1,6 +1,5 @@
 #!/usr/bin/env node
 
-import { defineCommand, runMain } from 'citty';
 import { readFileSync } from 'node:fs';
 import { dirname, join } from 'node:path';
 import { fileURLToPath } from 'node:url';
@@ -10,6 +9,15 @@ const pkg = JSON.parse(
 	readFileSync(join(__dirname, '..', 'package.json'), 'utf-8'),
 );
 
+// Answer `--version` before loading citty or any command module
+const raw_args = process.argv.slice(2);
+if (raw_args.length === 1 && raw_args[0] === '--version') {
+	console.log(pkg.version);
+	process.exit(0);
+}
+
+const { defineCommand, runMain } = await import('citty');
+
 const main = defineCommand({
 	meta: {
 		name: 'claude-skills-cli',
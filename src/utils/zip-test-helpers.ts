@@ -0,0 +1,57 @@
+/**
+ * Test helpers for reading back archives written by ZipWriter
+ */
+
+import { readFileSync } from 'node:fs';
+import { inflateRawSync } from 'node:zlib';
+import { expect } from 'vitest';
+import { METHOD_DEFLATED } from './zip.js';
+
+export interface ZipEntry {
+	name: string;
+	method: number;
+	data: Buffer;
+	mode: number;
+}
+
+/**
+ * Parse an archive back through its central directory
+ */
+export function read_zip_entries(zip_file: string): ZipEntry[] {
+	const zip = readFileSync(zip_file);
+	const end = zip.length - 22;
+	expect(zip.readUInt32LE(end)).toBe(0x06054b50);
+	const count = zip.readUInt16LE(end + 10);
+	let pos = zip.readUInt32LE(end + 16);
+
+	const entries: ZipEntry[] = [];
+	for (let i = 0; i < count; i++) {
+		expect(zip.readUInt32LE(pos)).toBe(0x02014b50);
+		const method = zip.readUInt16LE(pos + 10);
+		const compressed_size = zip.readUInt32LE(pos + 20);
+		const name_length = zip.readUInt16LE(pos + 28);
+		const mode = zip.readUInt32LE(pos + 38) >>> 16;
+		const local = zip.readUInt32LE(pos + 42);
+		const name = zip.toString(
+			'utf-8',
+			pos + 46,
+			pos + 46 + name_length,
+		);
+
+		const data_start =
+			local +
+			30 +
+			zip.readUInt16LE(local + 26) +
+			zip.readUInt16LE(local + 28);
+		const raw = zip.subarray(
+			data_start,
+			data_start + compressed_size,
+		);
+		const data =
+			method === METHOD_DEFLATED ? inflateRawSync(raw) : raw;
+
+		entries.push({ name, method, data, mode });
+		pos += 46 + name_length;
+	}
+	return entries;
+}
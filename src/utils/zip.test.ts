@@ -0,0 +1,173 @@
+import {
+	closeSync,
+	mkdtempSync,
+	openSync,
+	readFileSync,
+	rmSync,
+	statSync,
+	writeFileSync,
+} from 'node:fs';
+import { tmpdir } from 'node:os';
+import { join } from 'node:path';
+import { afterEach, beforeEach, describe, expect, it } from 'vitest';
+import {
+	crc32,
+	METHOD_DEFLATED,
+	METHOD_STORED,
+	ZipWriter,
+} from './zip.js';
+import { read_zip_entries } from './zip-test-helpers.js';
+
+describe('crc32', () => {
+	it('should match the standard check value', () => {
+		expect(crc32(Buffer.from('123456789'))).toBe(0xcbf43926);
+	});
+
+	it('should return 0 for empty input', () => {
+		expect(crc32(Buffer.alloc(0))).toBe(0);
+	});
+});
+
+describe('ZipWriter', () => {
+	let tmp_dir: string;
+	let output_file: string;
+
+	beforeEach(() => {
+		tmp_dir = mkdtempSync(join(tmpdir(), 'zip-test-'));
+		output_file = join(tmp_dir, 'out.zip');
+	});
+
+	afterEach(() => {
+		rmSync(tmp_dir, { recursive: true, force: true });
+	});
+
+	it('should write an empty archive', () => {
+		new ZipWriter(output_file).close();
+		expect(read_zip_entries(output_file)).toHaveLength(0);
+	});
+
+	it('should round-trip file contents, names and modes', () => {
+		const zip = new ZipWriter(output_file);
+		zip.add_file(
+			'skill/SKILL.md',
+			Buffer.from('# Skill\n'.repeat(50)),
+		);
+		zip.add_file(
+			'skill/scripts/run.sh',
+			Buffer.from('#!/bin/sh\n'),
+			{ mode: 0o100755 },
+		);
+		zip.close();
+
+		const entries = read_zip_entries(output_file);
+		expect(entries).toHaveLength(2);
+		expect(entries[0].name).toBe('skill/SKILL.md');
+		expect(entries[0].method).toBe(METHOD_DEFLATED);
+		expect(entries[0].data.toString()).toBe('# Skill\n'.repeat(50));
+		expect(entries[1].name).toBe('skill/scripts/run.sh');
+		expect(entries[1].data.toString()).toBe('#!/bin/sh\n');
+		expect(entries[1].mode).toBe(0o100755);
+	});
+
+	it('should write directory entries', () => {
+		const zip = new ZipWriter(output_file);
+		zip.add_directory('skill/assets', { mode: 0o40700 });
+		zip.add_directory('skill/empty/');
+		zip.close();
+
+		const entries = read_zip_entries(output_file);
+		expect(entries.map((entry) => entry.name)).toEqual([
+			'skill/assets/',
+			'skill/empty/',
+		]);
+		expect(entries[0].method).toBe(METHOD_STORED);
+		expect(entries[0].data).toHaveLength(0);
+		expect(entries[0].mode).toBe(0o40700);
+		expect(entries[1].mode).toBe(0o40755);
+	});
+
+	it('should store without deflating when asked to', () => {
+		const data = Buffer.from('x'.repeat(1000));
+		const zip = new ZipWriter(output_file);
+		zip.add_file('skill/assets/image.png', data, { store: true });
+		zip.close();
+
+		const [entry] = read_zip_entries(output_file);
+		expect(entry.method).toBe(METHOD_STORED);
+		expect(entry.data.equals(data)).toBe(true);
+	});
+
+	it('should store data that does not compress', () => {
+		const zip = new ZipWriter(output_file);
+		zip.add_file('skill/tiny.txt', Buffer.from('a'));
+		zip.close();
+
+		const [entry] = read_zip_entries(output_file);
+		expect(entry.method).toBe(METHOD_STORED);
+		expect(entry.data.toString()).toBe('a');
+	});
+
+	function add_from_file(
+		zip: ZipWriter,
+		name: string,
+		data: Buffer,
+		store = false,
+	): void {
+		const source = join(tmp_dir, 'source.bin');
+		writeFileSync(source, data);
+		const fd = openSync(source, 'r');
+		try {
+			zip.add_file_from_fd(name, fd, { store });
+		} finally {
+			closeSync(fd);
+		}
+	}
+
+	it('should stream multi-chunk files from a descriptor', () => {
+		// Spans several 1 MiB chunks, with a partial final chunk
+		const data = Buffer.from(
+			'Line of skill reference text\n'.repeat(120_000),
+		);
+		const zip = new ZipWriter(output_file);
+		add_from_file(zip, 'skill/references/big.md', data);
+		zip.add_file('skill/SKILL.md', Buffer.from('# Skill\n'));
+		zip.close();
+
+		const entries = read_zip_entries(output_file);
+		expect(entries).toHaveLength(2);
+		expect(entries[0].method).toBe(METHOD_DEFLATED);
+		expect(entries[0].data.equals(data)).toBe(true);
+		expect(entries[1].data.toString()).toBe('# Skill\n');
+
+		// Local header is patched with the final CRC and sizes
+		const archive = readFileSync(output_file);
+		expect(archive.readUInt32LE(14)).toBe(crc32(data));
+		expect(archive.readUInt32LE(22)).toBe(data.length);
+	});
+
+	it('should stream empty and stored files', () => {
+		const data = Buffer.alloc(3 * 1024 * 1024 + 5, 7);
+		const zip = new ZipWriter(output_file);
+		add_from_file(zip, 'skill/empty.md', Buffer.alloc(0));
+		add_from_file(zip, 'skill/assets/blob.png', data, true);
+		zip.close();
+
+		const entries = read_zip_entries(output_file);
+		expect(entries[0].data).toHaveLength(0);
+		expect(entries[1].method).toBe(METHOD_STORED);
+		expect(entries[1].data.equals(data)).toBe(true);
+	});
+
+	it('should refuse more entries than the archive can record', () => {
+		const zip = new ZipWriter(output_file);
+		const empty = Buffer.alloc(0);
+		for (let i = 0; i <= 0xffff; i++) {
+			zip.add_file(`skill/${i}`, empty, { store: true });
+		}
+		const size = statSync(output_file).size;
+
+		expect(() => zip.close()).toThrow('ZIP64 is not supported');
+		// Nothing of the central directory was written
+		expect(statSync(output_file).size).toBe(size);
+	});
+});
@@ -0,0 +1,340 @@
+/**
+ * Minimal ZIP archive writer (stored and deflated entries)
+ */
+
+import { closeSync, openSync, readSync, writeSync } from 'node:fs';
+import {
+	constants,
+	deflateRawSync,
+	type ZlibOptions,
+} from 'node:zlib';
+
+const LOCAL_HEADER_SIGNATURE = 0x04034b50;
+const CENTRAL_HEADER_SIGNATURE = 0x02014b50;
+const END_OF_CENTRAL_DIR_SIGNATURE = 0x06054b50;
+
+/** Version 2.0 — deflate, directories */
+const ZIP_VERSION = 20;
+/** "Version made by" host 3 = UNIX, so file modes are honoured */
+const MADE_BY_UNIX = 3 << 8;
+/** General purpose flag bit 11: file names are UTF-8 */
+const FLAG_UTF8 = 0x0800;
+/** File type bits of a UNIX mode, and the directory type */
+const S_IFMT = 0o170000;
+const S_IFDIR = 0o040000;
+/** MS-DOS directory attribute */
+const DOS_DIRECTORY = 0x10;
+/** Largest size or offset a non-ZIP64 archive can record */
+const MAX_UINT32 = 0xffffffff;
+/** Largest entry count a non-ZIP64 archive can record */
+const MAX_UINT16 = 0xffff;
+/** Read size when streaming a file into the archive */
+const STREAM_CHUNK_SIZE = 1024 * 1024;
+
+export const METHOD_STORED = 0;
+export const METHOD_DEFLATED = 8;
+
+export interface ZipWriterOptions {
+	/** zlib compression level, 0-9 (default 6) */
+	level?: number;
+}
+
+export interface ZipFileOptions {
+	mtime?: Date;
+	mode?: number;
+	/** Store as-is without trying to deflate (already compressed) */
+	store?: boolean;
+}
+
+interface EntryRecord {
+	name: Buffer;
+	method: number;
+	time: number;
+	date: number;
+	crc: number;
+	compressed_size: number;
+	size: number;
+	mode: number;
+	offset: number;
+}
+
+const CRC_TABLE = (() => {
+	const table = new Uint32Array(256);
+	for (let n = 0; n < 256; n++) {
+		let c = n;
+		for (let k = 0; k < 8; k++) {
+			c = c & 1 ? 0xedb88320 ^ (c >>> 1) : c >>> 1;
+		}
+		table[n] = c >>> 0;
+	}
+	return table;
+})();
+
+/**
+ * CRC-32 (IEEE) checksum as used by ZIP
+ */
+export function crc32(data: Uint8Array, crc: number = 0): number {
+	let c = ~crc;
+	for (let i = 0; i < data.length; i++) {
+		c = CRC_TABLE[(c ^ data[i]) & 0xff] ^ (c >>> 8);
+	}
+	return ~c >>> 0;
+}
+
+/**
+ * Convert a date to MS-DOS time/date fields (2 second resolution)
+ */
+function to_dos_date_time(date: Date): {
+	time: number;
+	date: number;
+} {
+	const year = Math.max(date.getFullYear(), 1980);
+	return {
+		time:
+			(date.getHours() << 11) |
+			(date.getMinutes() << 5) |
+			(date.getSeconds() >> 1),
+		date:
+			((year - 1980) << 9) |
+			((date.getMonth() + 1) << 5) |
+			date.getDate(),
+	};
+}
+
+/**
+ * Read the next chunk from a descriptor's current position
+ */
+function read_chunk(fd: number): Buffer {
+	const buffer = Buffer.allocUnsafe(STREAM_CHUNK_SIZE);
+	const bytes_read = readSync(fd, buffer, 0, STREAM_CHUNK_SIZE, null);
+	return buffer.subarray(0, bytes_read);
+}
+
+/**
+ * Writes a ZIP archive entry by entry straight to disk
+ */
+export class ZipWriter {
+	private fd: number;
+	private deflate_options: ZlibOptions;
+	private offset = 0;
+	private central_headers: Buffer[] = [];
+
+	constructor(output_file: string, options: ZipWriterOptions = {}) {
+		this.fd = openSync(output_file, 'w');
+		this.deflate_options = { level: options.level ?? 6 };
+	}
+
+	private write(buffer: Buffer): void {
+		writeSync(this.fd, buffer);
+		this.offset += buffer.length;
+	}
+
+	private start_entry(
+		name: string,
+		options: ZipFileOptions,
+	): EntryRecord {
+		const { mtime = new Date(), mode = 0o100644 } = options;
+		return {
+			name: Buffer.from(name, 'utf-8'),
+			method: METHOD_STORED,
+			...to_dos_date_time(mtime),
+			crc: 0,
+			compressed_size: 0,
+			size: 0,
+			mode,
+			offset: this.offset,
+		};
+	}
+
+	private local_header(entry: EntryRecord): Buffer {
+		if (
+			entry.size > MAX_UINT32 ||
+			entry.compressed_size > MAX_UINT32 ||
+			entry.offset > MAX_UINT32
+		) {
+			throw new Error(
+				`Cannot add ${entry.name.toString()}: archive would exceed 4 GiB (ZIP64 is not supported)`,
+			);
+		}
+
+		const local = Buffer.alloc(30);
+		local.writeUInt32LE(LOCAL_HEADER_SIGNATURE, 0);
+		local.writeUInt16LE(ZIP_VERSION, 4);
+		local.writeUInt16LE(FLAG_UTF8, 6);
+		local.writeUInt16LE(entry.method, 8);
+		local.writeUInt16LE(entry.time, 10);
+		local.writeUInt16LE(entry.date, 12);
+		local.writeUInt32LE(entry.crc, 14);
+		local.writeUInt32LE(entry.compressed_size, 18);
+		local.writeUInt32LE(entry.size, 22);
+		local.writeUInt16LE(entry.name.length, 26);
+		local.writeUInt16LE(0, 28); // extra field length
+		return local;
+	}
+
+	private finish_entry(entry: EntryRecord): void {
+		const central = Buffer.alloc(46);
+		central.writeUInt32LE(CENTRAL_HEADER_SIGNATURE, 0);
+		central.writeUInt16LE(MADE_BY_UNIX | ZIP_VERSION, 4);
+		central.writeUInt16LE(ZIP_VERSION, 6);
+		central.writeUInt16LE(FLAG_UTF8, 8);
+		central.writeUInt16LE(entry.method, 10);
+		central.writeUInt16LE(entry.time, 12);
+		central.writeUInt16LE(entry.date, 14);
+		central.writeUInt32LE(entry.crc, 16);
+		central.writeUInt32LE(entry.compressed_size, 20);
+		central.writeUInt32LE(entry.size, 24);
+		central.writeUInt16LE(entry.name.length, 28);
+		central.writeUInt16LE(0, 30); // extra field length
+		central.writeUInt16LE(0, 32); // comment length
+		central.writeUInt16LE(0, 34); // disk number
+		central.writeUInt16LE(0, 36); // internal attributes
+		// UNIX mode in the high word, MS-DOS attributes in the low one
+		const dos_attributes =
+			(entry.mode & S_IFMT) === S_IFDIR ? DOS_DIRECTORY : 0;
+		central.writeUInt32LE(
+			(((entry.mode & 0xffff) << 16) | dos_attributes) >>> 0,
+			38,
+		);
+		central.writeUInt32LE(entry.offset, 42);
+		this.central_headers.push(Buffer.concat([central, entry.name]));
+	}
+
+	/**
+	 * Add a file, deflating it unless told to store it or deflating
+	 * would not make it smaller
+	 */
+	public add_file(
+		name: string,
+		data: Buffer,
+		options: ZipFileOptions = {},
+	): void {
+		const entry = this.start_entry(name, options);
+		entry.crc = crc32(data);
+		entry.size = data.length;
+
+		let payload = data;
+		if (!options.store) {
+			const deflated = deflateRawSync(data, this.deflate_options);
+			if (deflated.length < data.length) {
+				entry.method = METHOD_DEFLATED;
+				payload = deflated;
+			}
+		}
+		entry.compressed_size = payload.length;
+
+		this.write(this.local_header(entry));
+		this.write(entry.name);
+		this.write(payload);
+		this.finish_entry(entry);
+	}
+
+	/**
+	 * Add a directory entry, so an empty directory survives extraction
+	 */
+	public add_directory(
+		name: string,
+		options: ZipFileOptions = {},
+	): void {
+		const entry = this.start_entry(
+			name.endsWith('/') ? name : `${name}/`,
+			{ ...options, mode: options.mode ?? S_IFDIR | 0o755 },
+		);
+		this.write(this.local_header(entry));
+		this.write(entry.name);
+		this.finish_entry(entry);
+	}
+
+	/**
+	 * Add a file by streaming it from an open descriptor in fixed-size
+	 * chunks, so memory use stays flat however large the file is.
+	 *
+	 * Each chunk is deflated independently and sync-flushed, which
+	 * concatenates into one valid deflate stream. The local header is
+	 * rewritten in place once the CRC and sizes are known.
+	 */
+	public add_file_from_fd(
+		name: string,
+		fd: number,
+		options: ZipFileOptions = {},
+	): void {
+		const entry = this.start_entry(name, options);
+		entry.method = options.store ? METHOD_STORED : METHOD_DEFLATED;
+
+		this.write(this.local_header(entry));
+		this.write(entry.name);
+
+		let chunk = read_chunk(fd);
+		let done = false;
+		while (!done) {
+			// Read one chunk ahead to know which one is last
+			const next = chunk.length > 0 ? read_chunk(fd) : chunk;
+			done = next.length === 0;
+
+			entry.crc = crc32(chunk, entry.crc);
+			entry.size += chunk.length;
+
+			const payload =
+				entry.method === METHOD_STORED
+					? chunk
+					: deflateRawSync(chunk, {
+							...this.deflate_options,
+							finishFlush: done
+								? constants.Z_FINISH
+								: constants.Z_SYNC_FLUSH,
+						});
+			this.write(payload);
+			entry.compressed_size += payload.length;
+
+			chunk = next;
+		}
+
+		const local = this.local_header(entry);
+		writeSync(this.fd, local, 0, local.length, entry.offset);
+		this.finish_entry(entry);
+	}
+
+	/**
+	 * Write the central directory and close the file
+	 */
+	public close(): void {
+		try {
+			const central_offset = this.offset;
+			let central_size = 0;
+			for (const header of this.central_headers) {
+				central_size += header.length;
+			}
+			const entry_count = this.central_headers.length;
+
+			// Check before writing, so an oversized archive fails with a
+			// clear error rather than a RangeError part-way through
+			if (central_offset + central_size > MAX_UINT32) {
+				throw new Error(
+					'Cannot write central directory: archive would exceed 4 GiB (ZIP64 is not supported)',
+				);
+			}
+			if (entry_count > MAX_UINT16) {
+				throw new Error(
+					`Cannot write ${entry_count} entries: archive is limited to ${MAX_UINT16} (ZIP64 is not supported)`,
+				);
+			}
+
+			for (const header of this.central_headers) {
+				this.write(header);
+			}
+
+			const end = Buffer.alloc(22);
+			end.writeUInt32LE(END_OF_CENTRAL_DIR_SIGNATURE, 0);
+			end.writeUInt16LE(0, 4); // this disk
+			end.writeUInt16LE(0, 6); // disk with central directory
+			end.writeUInt16LE(entry_count, 8);
+			end.writeUInt16LE(entry_count, 10);
+			end.writeUInt32LE(central_size, 12);
+			end.writeUInt32LE(central_offset, 16);
+			end.writeUInt16LE(0, 20); // comment length
+			this.write(end);
+		} finally {
+			closeSync(this.fd);
+		}
+	}
+}
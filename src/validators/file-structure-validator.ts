@@ -3,17 +3,23 @@
  */
 
 import {
+	closeSync,
 	existsSync,
+	fstatSync,
+	openSync,
 	readdirSync,
-	readFileSync,
+	readSync,
 	statSync,
 } from 'node:fs';
-import { join } from 'node:path';
+import { extname, join } from 'node:path';
 import type {
 	PathFormatValidation,
 	PathFormatIssue,
 } from '../types.js';
 
+/** Extensions recognised as scripts in scripts/ */
+const SCRIPT_EXTENSIONS = new Set(['.js', '.ts', '.mjs', '.sh']);
+
 export interface PathFormatError {
 	type: 'windows_path';
 	message: string;
@@ -42,8 +48,9 @@ export function validate_directory(skill_path: string): {
 	errors: DirectoryError[];
 } {
 	const errors: DirectoryError[] = [];
+	const stats = statSync(skill_path, { throwIfNoEntry: false });
 
-	if (!existsSync(skill_path)) {
+	if (!stats) {
 		errors.push({
 			type: 'not_found',
 			message: `Skill directory does not exist: ${skill_path}`,
@@ -51,7 +58,6 @@ export function validate_directory(skill_path: string): {
 		return { valid: false, errors };
 	}
 
-	const stats = statSync(skill_path);
 	if (!stats.isDirectory()) {
 		errors.push({
 			type: 'not_directory',
@@ -126,14 +132,16 @@ export function validate_scripts(skill_path: string): {
 	const warnings: ScriptsWarning[] = [];
 
 	if (existsSync(scripts_dir)) {
-		const files = readdirSync(scripts_dir);
-		const script_files = files.filter(
-			(f) =>
-				f.endsWith('.js') ||
-				f.endsWith('.ts') ||
-				f.endsWith('.mjs') ||
-				f.endsWith('.sh'),
-		);
+		// Dirent types let directories be skipped without a stat
+		const script_files = readdirSync(scripts_dir, {
+			withFileTypes: true,
+		})
+			.filter(
+				(entry) =>
+					!entry.isDirectory() &&
+					SCRIPT_EXTENSIONS.has(extname(entry.name)),
+			)
+			.map((entry) => entry.name);
 
 		if (script_files.length === 0) {
 			warnings.push({
@@ -142,26 +150,30 @@ export function validate_scripts(skill_path: string): {
 			});
 		}
 
-		for (const script_file of script_files) {
-			const script_path = join(scripts_dir, script_file);
-			const stats = statSync(script_path);
-
-			// Check if executable (0o111 = --x--x--x)
-			if ((stats.mode & 0o111) === 0) {
-				warnings.push({
-					type: 'not_executable',
-					message: `Script is not executable: ${script_file}`,
-				});
-			}
+		// Only the first two bytes are needed for the shebang check
+		const head = Buffer.alloc(2);
 
-			// Check for shebang
-			const content = readFileSync(script_path, 'utf-8');
-			const first_line = content.split('\n')[0];
-			if (!first_line.startsWith('#!')) {
-				warnings.push({
-					type: 'missing_shebang',
-					message: `Script missing shebang: ${script_file}`,
-				});
+		for (const script_file of script_files) {
+			const fd = openSync(join(scripts_dir, script_file), 'r');
+			try {
+				// Check if executable (0o111 = --x--x--x)
+				if ((fstatSync(fd).mode & 0o111) === 0) {
+					warnings.push({
+						type: 'not_executable',
+						message: `Script is not executable: ${script_file}`,
+					});
+				}
+
+				// Check for shebang
+				const bytes_read = readSync(fd, head, 0, 2, 0);
+				if (head.toString('latin1', 0, bytes_read) !== '#!') {
+					warnings.push({
+						type: 'missing_shebang',
+						message: `Script missing shebang: ${script_file}`,
+					});
+				}
+			} finally {
+				closeSync(fd);
 			}
 		}
 	}
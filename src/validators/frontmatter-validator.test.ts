@@ -72,6 +72,21 @@ describe('extract_frontmatter', () => {
 		expect(result.name).toBe('test');
 		expect(result.body).toContain('---');
 	});
+
+	it('should fold continuation lines into the description', () => {
+		const content =
+			'---\nname: test\ndescription: First line\n  continued here\n---\nBody';
+		const result = extract_frontmatter(content);
+		expect(result.description).toBe('First line continued here');
+		expect(result.description_is_multiline).toBe(true);
+	});
+
+	it('should not absorb following hyphenated fields into the description', () => {
+		const content =
+			'---\nname: test\ndescription: Desc\nallowed-tools: Read\n---\nBody';
+		const result = extract_frontmatter(content);
+		expect(result.description).toBe('Desc');
+	});
 });
 
 describe('validate_frontmatter_structure', () => {
@@ -13,6 +13,27 @@ import type {
 	YAMLValidation,
 } from '../types.js';
 
+/** Frontmatter scanning patterns, compiled once at module load */
+const DESCRIPTION_LINE_REGEX = /^description:\s*(.*)$/m;
+const FIELD_START_REGEX = /^[a-z_-]+:/;
+const FIELD_LINE_REGEX = /^([a-z][a-z0-9_-]*):\s*(.*)/;
+const INDENTED_LINE_REGEX = /^\s+\S/;
+const LIST_ITEM_REGEX = /^\s+-\s+(.+)/;
+const SURROUNDING_QUOTES_REGEX = /^["']|["']$/g;
+const KEBAB_CASE_REGEX = /^[a-z0-9-]+$/;
+
+/**
+ * YAML block scalar indicators that carry no value themselves
+ */
+const BLOCK_SCALAR_INDICATORS = new Set([
+	'>',
+	'|',
+	'>-',
+	'|-',
+	'>+',
+	'|+',
+]);
+
 export interface FrontmatterData {
 	name: string | null;
 	description: string | null;
@@ -34,7 +55,7 @@ export function is_description_multiline(
 	frontmatter: string,
 ): boolean {
 	// Find the description line
-	const desc_line_match = frontmatter.match(/^description:\s*(.*)$/m);
+	const desc_line_match = frontmatter.match(DESCRIPTION_LINE_REGEX);
 	if (!desc_line_match) {
 		return false;
 	}
@@ -52,21 +73,21 @@ export function is_description_multiline(
 	let found_desc = false;
 	for (let i = 0; i < lines.length; i++) {
 		const line = lines[i];
-		if (line.match(/^description:/)) {
+		if (line.startsWith('description:')) {
 			found_desc = true;
 			continue;
 		}
 		if (found_desc) {
 			// If next line starts with spaces/tabs and is not a comment and is not another field
 			if (
-				line.match(/^\s+\S/) &&
+				INDENTED_LINE_REGEX.test(line) &&
 				!line.trim().startsWith('#') &&
-				!line.match(/^[a-z_-]+:/)
+				!FIELD_START_REGEX.test(line)
 			) {
 				return true;
 			}
 			// Stop checking after we hit another field or end
-			if (line.match(/^[a-z_-]+:/)) {
+			if (FIELD_START_REGEX.test(line)) {
 				break;
 			}
 		}
@@ -75,6 +96,50 @@ export function is_description_multiline(
 	return false;
 }
 
+/**
+ * Read top-level `key: value` pairs from raw frontmatter in a single
+ * pass. Indented continuation lines are folded into the value of the
+ * field they follow.
+ */
+function read_scalar_fields(
+	frontmatter: string,
+): Map<string, string> {
+	const fields = new Map<string, string>();
+	let current: string | null = null;
+
+	for (const line of frontmatter.split('\n')) {
+		const trimmed = line.trim();
+		if (!trimmed || trimmed.startsWith('#')) continue;
+
+		if (line.startsWith(' ') || line.startsWith('\t')) {
+			if (current !== null) {
+				const value = fields.get(current);
+				fields.set(current, value ? `${value} ${trimmed}` : trimmed);
+			}
+			continue;
+		}
+
+		const colon = line.indexOf(':');
+		if (colon === -1) {
+			current = null;
+			continue;
+		}
+
+		const key = line.slice(0, colon).trim();
+		if (fields.has(key)) {
+			// First occurrence wins, as with a regex search
+			current = null;
+			continue;
+		}
+
+		const value = line.slice(colon + 1).trim();
+		fields.set(key, BLOCK_SCALAR_INDICATORS.has(value) ? '' : value);
+		current = key;
+	}
+
+	return fields;
+}
+
 /**
  * Extract frontmatter and body from SKILL.md content
  */
@@ -103,15 +168,10 @@ export function extract_frontmatter(
 	const frontmatter = parts[1];
 	const body = parts.slice(2).join('---\n');
 
-	// Extract name
-	const name_match = frontmatter.match(/name:\s*(.+)/);
-	const name = name_match ? name_match[1].trim() : null;
-
-	// Extract description
-	const desc_match = frontmatter.match(
-		/description:\s*(.+?)(?=\n[a-z]+:|$)/s,
-	);
-	const description = desc_match ? desc_match[1].trim() : null;
+	// Extract name and description
+	const fields = read_scalar_fields(frontmatter);
+	const name = fields.get('name') || null;
+	const description = fields.get('description') || null;
 
 	// Check if description spans multiple lines in the raw YAML
 	const description_is_multiline =
@@ -129,10 +189,12 @@ export function extract_array_field(
 	field: string,
 ): string[] | null {
 	const lines = frontmatter.split('\n');
+	// Build the field pattern once rather than once per line
+	const field_regex = new RegExp(`^${field}:\\s*`);
 	let field_index = -1;
 
 	for (let i = 0; i < lines.length; i++) {
-		if (lines[i].match(new RegExp(`^${field}:`))) {
+		if (field_regex.test(lines[i])) {
 			field_index = i;
 			break;
 		}
@@ -141,7 +203,7 @@ export function extract_array_field(
 	if (field_index === -1) return null;
 
 	const value = lines[field_index]
-		.replace(new RegExp(`^${field}:\\s*`), '')
+		.replace(field_regex, '')
 		.trim();
 
 	// Inline bracket syntax: [item1, item2]
@@ -150,17 +212,19 @@ export function extract_array_field(
 		if (!inner.trim()) return [];
 		return inner
 			.split(',')
-			.map((s) => s.trim().replace(/^["']|["']$/g, ''));
+			.map((s) => s.trim().replace(SURROUNDING_QUOTES_REGEX, ''));
 	}
 
 	// Empty value — check for YAML list items on following lines
 	if (!value) {
 		const items: string[] = [];
 		for (let i = field_index + 1; i < lines.length; i++) {
-			const item_match = lines[i].match(/^\s+-\s+(.+)/);
+			const item_match = lines[i].match(LIST_ITEM_REGEX);
 			if (item_match) {
-				items.push(item_match[1].trim().replace(/^["']|["']$/g, ''));
-			} else if (lines[i].match(/^[a-z]/)) {
+				items.push(
+					item_match[1].trim().replace(SURROUNDING_QUOTES_REGEX, ''),
+				);
+			} else if (/^[a-z]/.test(lines[i])) {
 				break; // next field
 			}
 		}
@@ -223,7 +287,7 @@ function extract_field_names(
 ): Map<string, string> {
 	const fields = new Map<string, string>();
 	for (const line of frontmatter.split('\n')) {
-		const match = line.match(/^([a-z][a-z0-9_-]*):\s*(.*)/);
+		const match = line.match(FIELD_LINE_REGEX);
 		if (match) {
 			fields.set(match[1], match[2].trim());
 		}
@@ -332,7 +396,7 @@ export function validate_name_format(
 	};
 
 	// Validate kebab-case format
-	if (!/^[a-z0-9-]+$/.test(name)) {
+	if (!KEBAB_CASE_REGEX.test(name)) {
 		validation.format_valid = false;
 		validation.errors.push(
 			`Skill name must be lowercase kebab-case: '${name}'`,
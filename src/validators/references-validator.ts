@@ -39,6 +39,28 @@ function strip_code_blocks(content: string): string {
 	return content.replace(/```[\s\S]*?```|~~~[\s\S]*?~~~/g, '');
 }
 
+/**
+ * List .md file names in a directory (Dirent types, no stat per entry)
+ */
+function list_md_files(dir: string): string[] {
+	return readdirSync(dir, { withFileTypes: true })
+		.filter(
+			(entry) => !entry.isDirectory() && entry.name.endsWith('.md'),
+		)
+		.map((entry) => entry.name);
+}
+
+/**
+ * Extract .md link targets, ignoring links inside code blocks
+ */
+function extract_md_links(content: string): string[] {
+	const reference_pattern = /\[([^\]]+)\]\(([^)]+\.md)\)/g;
+	const content_without_code = strip_code_blocks(content);
+	return [...content_without_code.matchAll(reference_pattern)].map(
+		(m) => m[2],
+	);
+}
+
 /**
  * Check nesting depth of reference files
  */
@@ -46,26 +68,26 @@ function check_reference_nesting(
 	skill_path: string,
 	file_path: string,
 	visited: Set<string> = new Set(),
+	links_cache: Map<string, string[] | null> = new Map(),
 ): { depth: number; references: string[] } {
 	if (visited.has(file_path)) {
 		return { depth: 0, references: [] };
 	}
 	visited.add(file_path);
 
-	const full_path = join(skill_path, file_path);
-	if (!existsSync(full_path)) {
+	// Each file is read and parsed once, however many paths reach it
+	let references = links_cache.get(file_path);
+	if (references === undefined) {
+		const full_path = join(skill_path, file_path);
+		references = existsSync(full_path)
+			? extract_md_links(readFileSync(full_path, 'utf-8'))
+			: null;
+		links_cache.set(file_path, references);
+	}
+	if (references === null) {
 		return { depth: 0, references: [] };
 	}
 
-	const content = readFileSync(full_path, 'utf-8');
-	// Strip code blocks to avoid parsing example links inside them
-	const content_without_code = strip_code_blocks(content);
-	const reference_pattern = /\[([^\]]+)\]\(([^)]+\.md)\)/g;
-	const matches = [
-		...content_without_code.matchAll(reference_pattern),
-	];
-	const references = matches.map((m) => m[2]);
-
 	if (references.length === 0) {
 		return { depth: 1, references: [] };
 	}
@@ -77,6 +99,7 @@ function check_reference_nesting(
 			skill_path,
 			ref,
 			new Set(visited),
+			links_cache,
 		);
 		max_depth = Math.max(max_depth, 1 + nested.depth);
 	}
@@ -89,21 +112,29 @@ function check_reference_nesting(
  */
 export function validate_references(
 	skill_path: string,
+	skill_md_content?: string,
 ): ReferencesResult {
 	const references_dir = join(skill_path, 'references');
 	const skill_md_path = join(skill_path, 'SKILL.md');
 
+	// Read SKILL.md at most once, reusing the caller's copy if given
+	const skill_content =
+		skill_md_content ??
+		(existsSync(skill_md_path)
+			? readFileSync(skill_md_path, 'utf-8')
+			: null);
+
 	const files_found: string[] = [];
 	const files_referenced: string[] = [];
 	const missing_files: string[] = [];
 	const nesting_data: ReferenceNesting[] = [];
+	const links_cache = new Map<string, string[] | null>();
 	const warnings: ReferencesWarning[] = [];
 	const errors: ReferencesError[] = [];
 
 	// Check references directory if it exists
 	if (existsSync(references_dir)) {
-		const files = readdirSync(references_dir);
-		const md_files = files.filter((f) => f.endsWith('.md'));
+		const md_files = list_md_files(references_dir);
 		files_found.push(...md_files.map((f) => `references/${f}`));
 
 		if (md_files.length === 0) {
@@ -114,9 +145,7 @@ export function validate_references(
 		}
 
 		// Check for references in SKILL.md
-		if (existsSync(skill_md_path)) {
-			const skill_content = readFileSync(skill_md_path, 'utf-8');
-
+		if (skill_content !== null) {
 			for (const md_file of md_files) {
 				if (!skill_content.includes(md_file)) {
 					warnings.push({
@@ -130,16 +159,12 @@ export function validate_references(
 
 	// Check root-level .md files (excluding SKILL.md)
 	if (existsSync(skill_path)) {
-		const root_files = readdirSync(skill_path);
-		const root_md_files = root_files.filter(
-			(f) =>
-				f.endsWith('.md') && f !== 'SKILL.md' && f !== 'README.md',
+		const root_md_files = list_md_files(skill_path).filter(
+			(f) => f !== 'SKILL.md' && f !== 'README.md',
 		);
 		files_found.push(...root_md_files);
 
-		if (existsSync(skill_md_path)) {
-			const skill_content = readFileSync(skill_md_path, 'utf-8');
-
+		if (skill_content !== null) {
 			for (const md_file of root_md_files) {
 				if (!skill_content.includes(md_file)) {
 					warnings.push({
@@ -152,8 +177,7 @@ export function validate_references(
 	}
 
 	// Level 3 validation: Check that all referenced files exist
-	if (existsSync(skill_md_path)) {
-		const skill_content = readFileSync(skill_md_path, 'utf-8');
+	if (skill_content !== null) {
 		// Strip code blocks to avoid parsing example links inside them
 		const content_without_code = strip_code_blocks(skill_content);
 
@@ -185,6 +209,8 @@ export function validate_references(
 				const nesting = check_reference_nesting(
 					skill_path,
 					file_path,
+					new Set(),
+					links_cache,
 				);
 				let warning: string | null = null;
 